@@ -10,8 +10,10 @@ setup(
     install_requires=[
         # Core FastAPI dependencies
         "fastapi>=0.104.0",
+        "fastapi-deferred-init>=0.2.2",
         "uvicorn[standard]>=0.24.0",
         "pydantic>=2.0.0",
+        "orjson>=3.9.0",
         
         # AWS and DynamoDB
         "boto3>=1.29.0",
@@ -30,6 +32,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-asyncio>=0.21.0",
+            'uvloop>=0.19.0; sys_platform != "win32"',
         ]
     }
 ) 
\ No newline at end of file
@@ -6,7 +6,8 @@ Follows the three-things rule: parse input, call service, return response.
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request
+from fastapi_deferred_init import DeferringAPIRouter as APIRouter
 from typing import List, Optional
 
 from api.models.action_item import ActionItem, ActionItemCreate, ActionItemUpdate
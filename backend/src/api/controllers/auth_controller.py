@@ -5,7 +5,8 @@ Handles HTTP requests for authentication operations.
 Follows the three-things rule: parse input, call service, return response.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Body, Response, Request
+from fastapi import Depends, HTTPException, status, Body, Response, Request
+from fastapi_deferred_init import DeferringAPIRouter as APIRouter
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, Optional
 import time
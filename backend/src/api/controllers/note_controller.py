@@ -5,7 +5,8 @@ Handles HTTP requests for note management operations.
 Follows the three-things rule: parse input, call service, return response.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import HTTPException, Query, Depends
+from fastapi_deferred_init import DeferringAPIRouter as APIRouter
 from typing import List, Optional, Dict
 import json
 import logging
@@ -5,7 +5,8 @@ Handles HTTP requests for project management operations.
 Follows the three-things rule: parse input, call service, return response.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import HTTPException, Depends
+from fastapi_deferred_init import DeferringAPIRouter as APIRouter
 from typing import List
 
 from api.models.project import Project, ProjectCreate, ProjectUpdate
@@ -5,107 +5,160 @@ This module provides middleware for logging requests and responses.
 """
 
 import logging
-import json
 import time
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Callable, Dict, Any
+from typing import Any, Dict, MutableMapping
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+# Headers whose values are never written to the logs
+_REDACTED_HEADERS = frozenset({'authorization', 'cookie', 'x-api-key'})
+
+# Request bodies are logged (at DEBUG) only up to this many bytes
+_MAX_LOGGED_BODY_BYTES = 1024
+
+class LoggingMiddleware:
     """
     Middleware for logging requests and responses.
+
+    Implemented as a pure ASGI middleware: the response body is streamed
+    straight through and only the ``http.response.start`` message is
+    inspected for the status code.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The next ASGI application in the stack
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request, log it, and pass it to the next middleware or endpoint.
-        
+
         Args:
-            request: The FastAPI request object
-            call_next: The next middleware or endpoint to call
-            
-        Returns:
-            The response from the next middleware or endpoint
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Start timer
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
         # Get request path and method
-        path = request.url.path
-        method = request.method
-        
-        # Log all endpoints for debugging
+        path = scope["path"]
+        method = scope["method"]
+
         # Log request
-        await self._log_request(request)
-        
+        self._log_request(scope)
+        if method in ('POST', 'PUT') and logger.isEnabledFor(logging.DEBUG):
+            receive = self._wrap_receive(receive)
+
+        status_holder: Dict[str, Any] = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+            await send(message)
+
         # Process the request
         try:
-            response = await call_next(request)
-            
-            # Log all endpoints for debugging
-            # Log response
-            duration_ms = (time.time() - start_time) * 1000
-            self._log_response(path, method, response.status_code, duration_ms)
-                
-            return response
-        except Exception as e:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
             # Log exception
-            logger.exception(f"Exception processing request: {path} {method}")
-                
+            logger.exception("Exception processing request: %s %s", path, method)
+
             # Re-raise the exception
             raise
-    
-    async def _log_request(self, request: Request) -> None:
+        finally:
+            # Log response
+            if "status" in status_holder:
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                self._log_response(path, method, status_holder["status"], duration_ms)
+
+    def _log_request(self, scope: Scope) -> None:
         """
         Log request details.
-        
+
         Args:
-            request: The FastAPI request object
+            scope: The ASGI connection scope
         """
-        # Get request path and method
-        path = request.url.path
-        method = request.method
-        
+        path = scope["path"]
+        method = scope["method"]
+
         # Log basic request info
-        logger.info(f"Request: {method} {path}")
-        logger.debug(f"Request details: client={request.client}, headers={dict(request.headers)}")
-        
-        # Log request body for POST and PUT requests
-        if method in ['POST', 'PUT']:
-            try:
-                # Clone the request body
-                body_bytes = await request.body()
-                
-                # Restore the request body
-                async def receive():
-                    return {"type": "http.request", "body": body_bytes}
-                request._receive = receive
-                
-                # Try to parse as JSON
-                try:
-                    body = json.loads(body_bytes)
-                    logger.debug(f"Request body: {json.dumps(body, default=str)}")
-                except:
-                    # If not JSON, log as string
-                    logger.debug(f"Request body: {body_bytes.decode('utf-8', errors='replace')}")
-            except Exception as e:
-                logger.warning(f"Could not log request body: {str(e)}")
-    
+        logger.info("Request: %s %s", method, path)
+        if logger.isEnabledFor(logging.DEBUG):
+            headers = {}
+            for key, value in scope.get("headers", []):
+                name = key.decode('latin-1')
+                headers[name] = '[REDACTED]' if name in _REDACTED_HEADERS else value.decode('latin-1')
+            logger.debug("Request details: client=%s, headers=%s", scope.get("client"), headers)
+
+    def _wrap_receive(self, receive: Receive) -> Receive:
+        """
+        Wrap the receive channel so the request body is logged as the app consumes it.
+
+        Only the first _MAX_LOGGED_BODY_BYTES are kept for logging.
+
+        Args:
+            receive: The ASGI receive channel
+
+        Returns:
+            A receive callable that buffers and logs the body once complete
+        """
+        head = bytearray()
+        size = 0
+
+        async def receive_wrapper() -> MutableMapping[str, Any]:
+            nonlocal size
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                size += len(body)
+                if len(head) < _MAX_LOGGED_BODY_BYTES:
+                    head.extend(body[:_MAX_LOGGED_BODY_BYTES - len(head)])
+                if not message.get("more_body", False):
+                    self._log_body(bytes(head), size)
+            return message
+
+        return receive_wrapper
+
+    def _log_body(self, body_head: bytes, size: int) -> None:
+        """
+        Log the start of a request body and its total size.
+
+        Args:
+            body_head: The first bytes of the request body, at most _MAX_LOGGED_BODY_BYTES
+            size: The full body size in bytes
+        """
+        logger.debug(
+            "Request body (%d bytes%s): %s",
+            size,
+            ", truncated" if size > len(body_head) else "",
+            body_head.decode('utf-8', errors='replace')
+        )
+
     def _log_response(self, path: str, method: str, status_code: int, duration_ms: float) -> None:
         """
         Log response details.
-        
+
         Args:
             path: The request path
             method: The request method
             status_code: The response status code
             duration_ms: The request duration in milliseconds
         """
-        logger.info(f"Response: {method} {path} - {status_code} ({duration_ms:.2f}ms)")
-        
+        logger.info("Response: %s %s - %s (%.2fms)", method, path, status_code, duration_ms)
+
         # Log more details for error responses
         if status_code >= 400:
-            logger.warning(f"Error response: {method} {path} - {status_code}") 
\ No newline at end of file
+            logger.warning("Error response: %s %s - %s", method, path, status_code)
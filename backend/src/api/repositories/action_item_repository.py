@@ -4,9 +4,11 @@ Action Item Repository
 This module provides data access layer for action items.
 """
 
+import asyncio
 import logging
 import uuid
-from typing import List, Optional, Dict, Any
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from datetime import datetime
 
 from api.models.action_item import ActionItem, ActionItemCreate, ActionItemUpdate
@@ -14,6 +16,8 @@ from infrastructure.dynamodb_client import DynamoDBClient
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 class ActionItemRepository:
     """Repository for action item data operations."""
     
@@ -27,6 +31,16 @@ class ActionItemRepository:
         self.dynamodb_client = dynamodb_client
         self.table_name = "action_items"
     
+    async def _run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking DynamoDB client call in the default thread pool.
+        
+        boto3 is synchronous; running its calls off the event loop lets
+        concurrent awaits (e.g. asyncio.gather over creates) overlap on the network.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+    
     async def create_action_item(self, action_item_data: ActionItemCreate) -> ActionItem:
         """
         Create a new action item.
@@ -61,7 +75,7 @@ class ActionItemRepository:
             }
             
             # Save to DynamoDB
-            self.dynamodb_client.put_item(self.table_name, action_item_record)
+            await self._run_blocking(self.dynamodb_client.put_item, self.table_name, action_item_record)
             
             logger.info(f"✅ Repository: Created action item {action_item_id} with source_note_id={action_item_record.get('source_note_id')}")
             return ActionItem(**action_item_record)
@@ -81,7 +95,8 @@ class ActionItemRepository:
             The action item if found, None otherwise
         """
         try:
-            result = self.dynamodb_client.get_item(
+            result = await self._run_blocking(
+                self.dynamodb_client.get_item,
                 self.table_name, 
                 {"id": action_item_id}
             )
@@ -199,7 +214,8 @@ class ActionItemRepository:
             
             # Only pass expression_attribute_names if it's not empty
             if expression_attribute_names:
-                self.dynamodb_client.update_item(
+                await self._run_blocking(
+                    self.dynamodb_client.update_item,
                     self.table_name,
                     {"id": action_item_id},
                     update_expression,
@@ -208,7 +224,8 @@ class ActionItemRepository:
                     expression_attribute_names
                 )
             else:
-                self.dynamodb_client.update_item(
+                await self._run_blocking(
+                    self.dynamodb_client.update_item,
                     self.table_name,
                     {"id": action_item_id},
                     update_expression,
@@ -259,7 +276,8 @@ class ActionItemRepository:
         """
         try:
             # Query by user_id (assuming we have a GSI on user_id)
-            result = self.dynamodb_client.query(
+            result = await self._run_blocking(
+                self.dynamodb_client.query,
                 self.table_name,
                 index_name="user_id-index",
                 key_condition_expression="user_id = :user_id",
@@ -319,7 +337,8 @@ class ActionItemRepository:
             if not existing_item:
                 return False
             
-            self.dynamodb_client.delete_item(
+            await self._run_blocking(
+                self.dynamodb_client.delete_item,
                 self.table_name,
                 {"id": action_item_id}
             )
@@ -334,7 +353,14 @@ class ActionItemRepository:
     async def create_table(self) -> None:
         """
         Create the action items table if it doesn't exist.
+        
+        The boto3 calls and table waiters block, so they run in a worker
+        thread and startup can create several tables at once.
         """
+        await self._run_blocking(self._create_table_blocking)
+    
+    def _create_table_blocking(self) -> None:
+        """Check for and create the table(s) with blocking boto3 calls."""
         try:
             # Check if table already exists
             if self.dynamodb_client.table_exists(self.table_name):
@@ -18,7 +18,7 @@ from fastapi import HTTPException
 
 from api.repositories.ai_repository import AIRepository
 from api.models.ai import AIConfiguration, AIUseCase
-from infrastructure.dynamodb_client import get_dynamodb_client
+from infrastructure.dynamodb_client import get_dynamodb_client, BOTO_CONFIG
 
 # Import default configurations
 from api.config.default_ai_configs import DEFAULT_CONFIGS
@@ -56,8 +56,8 @@ class AIRepositoryImpl(AIRepository):
             # Get endpoint URL for local development
             endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL") or os.environ.get("DYNAMODB_ENDPOINT")
             
-            # Initialize DynamoDB resource
-            kwargs = {"region_name": region}
+            # Initialize DynamoDB resource with the shared keep-alive/pool settings
+            kwargs = {"region_name": region, "config": BOTO_CONFIG}
             if endpoint_url:
                 kwargs["endpoint_url"] = endpoint_url
             
@@ -80,10 +80,16 @@ class AIRepositoryImpl(AIRepository):
             return
         
         try:
-            # Check if table exists
-            existing_tables = self._dynamodb.meta.client.list_tables()["TableNames"]
+            # Check if table exists with a single DescribeTable instead of ListTables
+            try:
+                self._dynamodb.meta.client.describe_table(TableName=self._table_name)
+                table_exists = True
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ResourceNotFoundException":
+                    raise
+                table_exists = False
             
-            if self._table_name not in existing_tables:
+            if not table_exists:
                 logger.info(f"Creating table: {self._table_name}")
                 
                 # Create the table
@@ -1,4 +1,5 @@
 import uuid
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -35,7 +36,14 @@ class DynamoDBNoteRepository(NoteRepository):
     async def create_table(self) -> None:
         """
         Create the Notes table if it doesn't exist.
+        
+        The boto3 calls and table waiters block, so they run in a worker
+        thread and startup can create several tables at once.
         """
+        await asyncio.to_thread(self._create_table_blocking)
+    
+    def _create_table_blocking(self) -> None:
+        """Check for and create the table(s) with blocking boto3 calls."""
         if not self.dynamodb_client.table_exists(self.table_name):
             logger.info(f"Creating {self.table_name} table...")
             self.dynamodb_client.create_table(
@@ -4,6 +4,7 @@ User Repository Implementation
 This module provides a DynamoDB implementation of the user repository interface.
 """
 
+import asyncio
 import logging
 from typing import Optional, Dict
 
@@ -19,6 +20,10 @@ class UserRepositoryImpl(UserRepository):
         self.dynamodb_client = get_dynamodb_client()
     
     async def create_user_table(self) -> None:
+        # The boto3 calls and table waiter block, so run them in a worker thread
+        await asyncio.to_thread(self._create_user_table_blocking)
+    
+    def _create_user_table_blocking(self) -> None:
         try:
             if not self.dynamodb_client.table_exists('Users'):
                 logger.info("Creating Users table...")
@@ -14,7 +14,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from api.services.ai_service import AIService
 from api.services.action_item_service import ActionItemService
-from api.services.monitoring_service import MonitoringService
+from api.services.monitoring_service import CapBSnapshot, MonitoringService
 from api.models.action_item import ActionItemUpdate
 
 # Use TYPE_CHECKING to avoid circular imports
@@ -80,7 +80,7 @@ class CapBService:
         Returns:
             bool: True if successful, False otherwise
         """
-        update_start = time.time()
+        update_start = time.perf_counter()
         logger.debug(f"🔄 CapB RETRY: Starting attempt for action item {action_item_id}")
         logger.debug(f"🔄 CapB RETRY: Update data type: {type(update_data)}")
         logger.debug(f"🔄 CapB RETRY: Update data - projects: {update_data.projects}")
@@ -90,11 +90,11 @@ class CapBService:
         try:
             # Log before calling action_item_service
             logger.debug(f"🔄 CapB RETRY: Calling action_item_service.update_action_item for {action_item_id}")
-            service_call_start = time.time()
+            service_call_start = time.perf_counter()
             
             result = await self.action_item_service.update_action_item(action_item_id, update_data)
             
-            service_call_time = time.time() - service_call_start
+            service_call_time = time.perf_counter() - service_call_start
             logger.debug(f"🔄 CapB RETRY: Service call completed in {service_call_time:.3f}s")
             logger.debug(f"🔄 CapB RETRY: Result type: {type(result)}")
             logger.debug(f"🔄 CapB RETRY: Result is None: {result is None}")
@@ -107,16 +107,16 @@ class CapBService:
                     logger.error(f"❌ CapB RETRY: Result object missing 'projects' attribute!")
                     logger.error(f"❌ CapB RETRY: Result object attributes: {dir(result)}")
                 
-                update_time = time.time() - update_start
+                update_time = time.perf_counter() - update_start
                 logger.debug(f"✅ CapB RETRY: Successfully updated {action_item_id} in {update_time:.3f}s (service: {service_call_time:.3f}s)")
                 return True
             else:
-                update_time = time.time() - update_start
+                update_time = time.perf_counter() - update_start
                 logger.error(f"❌ CapB RETRY: Update returned None for {action_item_id} after {update_time:.3f}s")
                 return False
             
         except Exception as e:
-            update_time = time.time() - update_start
+            update_time = time.perf_counter() - update_start
             error_type = type(e).__name__
             logger.error(f"❌ CapB RETRY: Exception in {action_item_id} after {update_time:.3f}s")
             logger.error(f"❌ CapB RETRY: Error type: {error_type}")
@@ -146,8 +146,9 @@ class CapBService:
                 "metrics": Dict[str, any]
             }
         """
-        start_time = time.time()
-        run_id = f"capb_{int(start_time)}_{user_id}"
+        start_time = time.perf_counter()
+        # Run IDs carry the wall-clock epoch so they line up with logs
+        run_id = f"capb_{int(time.time())}_{user_id}"
         logger.info(f"🚀 CapB TIMING: Starting CapB run {run_id} for user {user_id}")
         
         # Safety check: ensure project_service is available
@@ -166,22 +167,22 @@ class CapBService:
         
         try:
             # Step 1: Get user's action items
-            fetch_actions_start = time.time()
+            fetch_actions_start = time.perf_counter()
             logger.debug(f"CapB TIMING: Fetching action items for user {user_id}")
             action_items = await self.action_item_service.get_action_items_by_user(user_id)
-            fetch_actions_time = time.time() - fetch_actions_start
+            fetch_actions_time = time.perf_counter() - fetch_actions_start
             logger.info(f"⏱️ CapB TIMING: Fetching action items took {fetch_actions_time:.2f}s - Found {len(action_items)} items")
             
             # Step 2: Get user's projects
-            fetch_projects_start = time.time()
+            fetch_projects_start = time.perf_counter()
             logger.debug(f"CapB TIMING: Fetching projects for user {user_id}")
             projects = await self.project_service.get_projects(user_id)
-            fetch_projects_time = time.time() - fetch_projects_start
+            fetch_projects_time = time.perf_counter() - fetch_projects_start
             logger.info(f"⏱️ CapB TIMING: Fetching projects took {fetch_projects_time:.2f}s - Found {len(projects)} projects")
             
             # Step 3: Early exit if no action items or projects
             if not action_items:
-                total_time = time.time() - start_time
+                total_time = time.perf_counter() - start_time
                 logger.info(f"🏁 CapB TIMING: No action items found, completed in {total_time:.2f}s")
                 result = {
                     "success": True,
@@ -195,7 +196,7 @@ class CapBService:
                 return result
             
             if not projects:
-                total_time = time.time() - start_time
+                total_time = time.perf_counter() - start_time
                 logger.info(f"🏁 CapB TIMING: No projects found, completed in {total_time:.2f}s")
                 result = {
                     "success": True,
@@ -209,7 +210,7 @@ class CapBService:
                 return result
             
             # Step 4: Prepare data for AI service
-            data_prep_start = time.time()
+            data_prep_start = time.perf_counter()
             logger.debug(f"CapB TIMING: Preparing data for AI analysis")
             action_items_data = [
                 {
@@ -234,28 +235,28 @@ class CapBService:
                 }
                 for project in projects
             ]
-            data_prep_time = time.time() - data_prep_start
+            data_prep_time = time.perf_counter() - data_prep_start
             logger.info(f"⏱️ CapB TIMING: Data preparation took {data_prep_time:.2f}s")
             
             # Step 5: Call AI service for project tagging
-            ai_call_start = time.time()
+            ai_call_start = time.perf_counter()
             logger.info(f"🤖 CapB TIMING: Calling AI service to tag {len(action_items)} action items with {len(projects)} projects")
             project_mappings = await self.ai_service.tag_action_items_with_projects({
                 "action_items": action_items_data,
                 "user_projects": projects_data
             })
-            ai_call_time = time.time() - ai_call_start
+            ai_call_time = time.perf_counter() - ai_call_start
             logger.info(f"⏱️ CapB TIMING: AI service call took {ai_call_time:.2f}s - Returned mappings for {len(project_mappings)} action items")
             
             # Step 6: Update action items with project associations
-            update_start = time.time()
+            update_start = time.perf_counter()
             tagged_count = 0
             failed_updates = []
             
             logger.info(f"🔄 CapB UPDATE LOOP: Starting to process {len(project_mappings)} action item updates")
             
             for i, (action_item_id, project_ids) in enumerate(project_mappings.items(), 1):
-                item_start = time.time()
+                item_start = time.perf_counter()
                 logger.info(f"🔄 CapB UPDATE LOOP: Processing item {i}/{len(project_mappings)}: {action_item_id}")
                 
                 try:
@@ -270,18 +271,18 @@ class CapBService:
                         
                         if success:
                             tagged_count += 1
-                            item_time = time.time() - item_start
+                            item_time = time.perf_counter() - item_start
                             logger.info(f"✅ CapB UPDATE LOOP: Successfully tagged item {i}/{len(project_mappings)} ({action_item_id}) with {len(project_ids)} projects in {item_time:.3f}s")
                         else:
-                            item_time = time.time() - item_start
+                            item_time = time.perf_counter() - item_start
                             logger.error(f"❌ CapB UPDATE LOOP: Failed to tag item {i}/{len(project_mappings)} ({action_item_id}) after {item_time:.3f}s")
                             failed_updates.append(action_item_id)
                     else:
-                        item_time = time.time() - item_start
+                        item_time = time.perf_counter() - item_start
                         logger.info(f"⏭️ CapB UPDATE LOOP: Item {i}/{len(project_mappings)} ({action_item_id}) has no projects to tag - skipped in {item_time:.3f}s")
                         
                 except Exception as e:
-                    item_time = time.time() - item_start
+                    item_time = time.perf_counter() - item_start
                     error_type = type(e).__name__
                     self._metrics["error_counts"][error_type] = self._metrics["error_counts"].get(error_type, 0) + 1
                     logger.error(f"❌ CapB UPDATE LOOP: Exception in item {i}/{len(project_mappings)} ({action_item_id}) after {item_time:.3f}s")
@@ -289,13 +290,13 @@ class CapBService:
                     failed_updates.append(action_item_id)
                     continue
             
-            update_time = time.time() - update_start
+            update_time = time.perf_counter() - update_start
             logger.info(f"⏱️ CapB TIMING: Updating action items took {update_time:.2f}s - Tagged {tagged_count} items")
             
             # Update metrics
             self._metrics["total_action_items_processed"] += len(action_items)
             self._metrics["total_action_items_tagged"] += tagged_count
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             self._metrics["average_processing_time"] = (
                 (self._metrics["average_processing_time"] * (self._metrics["total_runs"] - 1) + processing_time)
                 / self._metrics["total_runs"]
@@ -308,7 +309,7 @@ class CapBService:
             else:
                 self._metrics["failed_runs"] += 1
             
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.info(f"🏁 CapB TIMING: CapB completed in {total_time:.2f}s for user {user_id}: {tagged_count}/{len(action_items)} action items tagged")
             if failed_updates:
                 logger.warning(f"⚠️ CapB TIMING: Had {len(failed_updates)} failed updates: {failed_updates}")
@@ -333,7 +334,7 @@ class CapBService:
             self._metrics["error_counts"][error_type] = self._metrics["error_counts"].get(error_type, 0) + 1
             self._metrics["failed_runs"] += 1
             
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             logger.error(f"❌ CapB TIMING: CapB failed after {total_time:.2f}s for user {user_id}: {str(e)}")
             logger.exception("CapB detailed error information:")
             
@@ -386,4 +387,16 @@ class CapBService:
         Returns:
             Success rate as a float between 0 and 1
         """
-        return self.monitoring_service.get_capb_success_rate(time_range) 
\ No newline at end of file
+        return self.monitoring_service.get_capb_success_rate(time_range)
+    
+    def get_snapshot(self, time_range: str = "all") -> CapBSnapshot:
+        """
+        Get CapB metrics, success rate and error rates for the specified time range.
+        
+        Args:
+            time_range: Time range to get the snapshot for ("hour", "day", "week", "all")
+            
+        Returns:
+            CapBSnapshot with "metrics", "success_rate" and "error_rates" keys
+        """
+        return self.monitoring_service.get_capb_snapshot(time_range) 
\ No newline at end of file
@@ -8,13 +8,21 @@ including CapB performance and error tracking.
 import logging
 import json
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+
+class CapBSnapshot(TypedDict):
+    """CapB metrics bucket for one time range with its derived rates."""
+    metrics: Dict[str, Any]
+    success_rate: float
+    error_rates: Dict[str, float]
+
+
 class MonitoringService:
     """
     Service for monitoring system metrics and performance.
@@ -199,17 +207,7 @@ class MonitoringService:
             Dictionary containing error rates by type
         """
         try:
-            metrics = self.get_capb_metrics(time_range)
-            total_runs = metrics.get("runs", 0)
-            
-            if total_runs == 0:
-                return {}
-            
-            error_rates = {}
-            for error_type, count in metrics.get("errors", {}).items():
-                error_rates[error_type] = count / total_runs
-            
-            return error_rates
+            return self._error_rates(self.get_capb_metrics(time_range))
             
         except Exception as e:
             logger.error(f"Error getting CapB error rates: {e}")
@@ -226,14 +224,57 @@ class MonitoringService:
             Success rate as a float between 0 and 1
         """
         try:
-            metrics = self.get_capb_metrics(time_range)
-            total_runs = metrics.get("runs", 0)
-            
-            if total_runs == 0:
-                return 0.0
-            
-            return metrics.get("successful_runs", 0) / total_runs
+            return self._success_rate(self.get_capb_metrics(time_range))
             
         except Exception as e:
             logger.error(f"Error getting CapB success rate: {e}")
-            return 0.0 
\ No newline at end of file
+            return 0.0
+    
+    def get_capb_snapshot(self, time_range: str = "all") -> CapBSnapshot:
+        """
+        Get CapB metrics, success rate and error rates for a time range at once.
+        
+        The time-range bucket is resolved once and both rates are derived
+        from it, instead of each getter looking it up again.
+        
+        Args:
+            time_range: Time range to get the snapshot for ("hour", "day", "week", "all")
+            
+        Returns:
+            CapBSnapshot with "metrics", "success_rate" and "error_rates" keys
+        """
+        metrics = self.get_capb_metrics(time_range)
+        try:
+            success_rate = self._success_rate(metrics)
+            error_rates = self._error_rates(metrics)
+        except Exception as e:
+            logger.error(f"Error computing CapB snapshot: {e}")
+            success_rate, error_rates = 0.0, {}
+        
+        return {
+            "metrics": metrics,
+            "success_rate": success_rate,
+            "error_rates": error_rates
+        }
+    
+    def _error_rates(self, metrics: Dict[str, Any]) -> Dict[str, float]:
+        """Compute error rates by type from a metrics bucket."""
+        total_runs: int = metrics.get("runs", 0)
+        
+        if total_runs == 0:
+            return {}
+        
+        return {
+            error_type: count / total_runs
+            for error_type, count in metrics.get("errors", {}).items()
+        }
+    
+    def _success_rate(self, metrics: Dict[str, Any]) -> float:
+        """Compute the success rate from a metrics bucket."""
+        total_runs: int = metrics.get("runs", 0)
+        
+        if total_runs == 0:
+            return 0.0
+        
+        successful_runs: int = metrics.get("successful_runs", 0)
+        return successful_runs / total_runs
@@ -45,7 +45,7 @@ logger = logging.getLogger(__name__)
 # STATELESS SINGLETON SERVICES (with @lru_cache)
 # =============================================================================
 
-@lru_cache()
+@lru_cache
 def get_monitoring_service() -> MonitoringService:
     """Get monitoring service singleton (stateless)."""
     logger.debug("Creating monitoring service singleton")
@@ -108,7 +108,11 @@ class DynamoDBInspector:
     
     def pretty_print_json(self, data: Any, indent: int = 2) -> None:
         """Pretty print JSON data."""
-        print(json.dumps(data, indent=indent, default=str, sort_keys=True))
+        print(self.format_json(data, indent))
+    
+    def format_json(self, data: Any, indent: int = 2) -> str:
+        """Format data as pretty-printed JSON."""
+        return json.dumps(data, indent=indent, default=str, sort_keys=True)
 
 
 def main():
@@ -156,9 +160,8 @@ Examples:
         if args.command == 'list-tables':
             tables = inspector.list_tables()
             if tables:
-                print("DynamoDB Tables:")
-                for table in tables:
-                    print(f"  - {table}")
+                # Build the listing first so it goes out in a single write
+                print("DynamoDB Tables:\n" + "\n".join(f"  - {table}" for table in tables))
             else:
                 print("No tables found")
         
@@ -174,9 +177,10 @@ Examples:
                 if args.pretty:
                     inspector.pretty_print_json(items)
                 else:
-                    for i, item in enumerate(items, 1):
-                        print(f"\nItem {i}:")
-                        inspector.pretty_print_json(item)
+                    print("".join(
+                        f"\nItem {i}:\n{inspector.format_json(item)}\n"
+                        for i, item in enumerate(items, 1)
+                    ), end="")
             else:
                 print(f"No items found in table '{args.table_name}'")
         
@@ -16,6 +16,7 @@ import logging
 import boto3
 import os
 from boto3.dynamodb.conditions import Key, Attr
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Dict, List, Any, Optional, Union, Iterable, Generator
 
@@ -24,6 +25,16 @@ logger = logging.getLogger(__name__)
 # Singleton instance of DynamoDB client
 _dynamodb_client_instance: Optional['DynamoDBClient'] = None
 
+# Connection pool, retry, timeout and keep-alive settings shared by all DynamoDB calls.
+# DYNAMODB_MAX_POOL_CONNECTIONS raises the pool for call-heavy scripts.
+BOTO_CONFIG = Config(
+    max_pool_connections=int(os.getenv('DYNAMODB_MAX_POOL_CONNECTIONS', '50')),
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=10,
+    tcp_keepalive=True
+)
+
 class DynamoDBClient:
     """
     A wrapper client for AWS DynamoDB.
@@ -58,6 +69,7 @@ class DynamoDBClient:
         # Configuration kwargs for boto3
         config_kwargs = {
             'region_name': region_name,
+            'config': BOTO_CONFIG,
         }
         
         if endpoint_url:
@@ -67,12 +79,12 @@ class DynamoDBClient:
             config_kwargs['aws_access_key_id'] = aws_access_key_id
             config_kwargs['aws_secret_access_key'] = aws_secret_access_key
         
-        # Configure the client
-        self.client = boto3.client('dynamodb', **config_kwargs)
-        
         # Create a resource for higher-level operations
         self.resource = boto3.resource('dynamodb', **config_kwargs)
         
+        # Reuse the resource's low-level client so both share one connection pool
+        self.client = self.resource.meta.client
+        
         logger.info(f"DynamoDB client initialized. Region: {region_name}, Endpoint: {endpoint_url or 'AWS Default'}")
 
     # Table operations
@@ -114,11 +126,13 @@ class DynamoDBClient:
         Returns:
             True if the table exists, False otherwise
         """
+        # A single DescribeTable answers this without paging through ListTables
         try:
-            tables = self.list_tables()
-            return table_name in tables
-        except ClientError:
-            logger.exception(f"Error checking if table {table_name} exists")
+            self.client.describe_table(TableName=table_name)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ResourceNotFoundException':
+                logger.exception(f"Error checking if table {table_name} exists")
             return False
     
     def create_table(self, table_name: str, key_schema: List[Dict], 
@@ -140,7 +154,8 @@ class DynamoDBClient:
             billing_mode: Billing mode for the table (PROVISIONED or PAY_PER_REQUEST)
             
         Returns:
-            Response from DynamoDB
+            Response from DynamoDB (the current description if another process
+            created the table concurrently)
             
         Raises:
             ValueError: If the table already exists or if provisioned_throughput is not provided for PROVISIONED billing mode
@@ -182,6 +197,11 @@ class DynamoDBClient:
             
             return response
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceInUseException':
+                # Another worker created it between the existence check and this call
+                logger.info(f"Table {table_name} was created concurrently; waiting for it")
+                self.client.get_waiter('table_exists').wait(TableName=table_name)
+                return {'TableDescription': self.client.describe_table(TableName=table_name)['Table']}
             logger.error(f"Failed to create table {table_name}: {str(e)}")
             raise
     
@@ -231,14 +251,13 @@ class DynamoDBClient:
             ValueError: If the table doesn't exist
             ClientError: If there's an error communicating with DynamoDB
         """
-        if not self.table_exists(table_name):
-            logger.warning(f"Table {table_name} does not exist")
-            raise ValueError(f"Table {table_name} does not exist")
-        
         try:
             response = self.client.describe_table(TableName=table_name)
             return response.get('Table', {})
         except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                logger.warning(f"Table {table_name} does not exist")
+                raise ValueError(f"Table {table_name} does not exist") from e
             logger.error(f"Failed to describe table {table_name}: {str(e)}")
             raise
     
@@ -892,7 +911,24 @@ class DynamoDBClient:
         Returns:
             The boto3 DynamoDB client
         """
-        return self.client 
+        return self.client
+    
+    def warm_up(self) -> bool:
+        """
+        Open a pooled connection with a cheap DescribeLimits call.
+        
+        The TCP/TLS handshake and credential lookup then happen here rather
+        than on the first real request. Failures are logged and ignored.
+        
+        Returns:
+            True if the call succeeded, False otherwise
+        """
+        try:
+            self.client.describe_limits()
+            return True
+        except Exception as e:
+            logger.warning(f"DynamoDB connection warm-up failed: {str(e)}")
+            return False
 
 def get_dynamodb_client() -> DynamoDBClient:
     """
@@ -900,7 +936,8 @@ def get_dynamodb_client() -> DynamoDBClient:
     
     This function implements the Singleton pattern to ensure only one DynamoDB
     client is created for the application. It retrieves configuration from
-    environment variables.
+    environment variables. Set DYNAMODB_PREWARM=true to open a connection
+    as soon as the client is created (useful for health checks and Lambda).
     
     Returns:
         DynamoDB client instance
@@ -931,5 +968,8 @@ def get_dynamodb_client() -> DynamoDBClient:
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key
         )
+        
+        if os.getenv('DYNAMODB_PREWARM', 'false').lower() == 'true':
+            _dynamodb_client_instance.warm_up()
     
     return _dynamodb_client_instance 
\ No newline at end of file
@@ -1,12 +1,20 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 import os
-from dotenv import load_dotenv
+import re
 
-# Load environment variables from .env.production or .env file
-load_dotenv('.env.production')  # Load production env first
-load_dotenv()  # Load local .env as fallback
+# Load environment variables from .env.production or .env file.
+# Production (Fly.io) injects its environment directly, so skip the file probes there.
+if os.getenv("ENVIRONMENT") != "production":
+    from dotenv import load_dotenv
+    load_dotenv('.env.production')  # Load production env first
+    load_dotenv()  # Load local .env as fallback
 from api.controllers.auth_controller import router as auth_router
 from api.controllers.project_controller import router as project_router
 from api.controllers.note_controller import router as note_router
@@ -25,15 +33,19 @@ from api.repositories.impl import (
     # get_ai_file_s3_repository,
     get_action_item_repository
 )
-# from api.middleware import LoggingMiddleware
+from api.middleware import LoggingMiddleware
 # from consumer.ai_file_consumer import create_consumer
 # from infrastructure.sqs_client import get_sqs_client
 # from infrastructure.s3_client import get_s3_client
 
-# Configure logging
+IS_PRODUCTION = os.getenv("ENVIRONMENT") == "production"
+
+# Configure logging (DEBUG locally, INFO in production)
+_LOG_LEVEL = logging.INFO if IS_PRODUCTION else logging.DEBUG
 logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=_LOG_LEVEL,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    force=True
 )
 
 # Set boto loggers to WARNING to reduce noise
@@ -43,64 +55,89 @@ logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create DynamoDB tables on startup and clean up on shutdown."""
+    try:
+        logger.info("Initializing application...")
+        
+        # Initialize auth, project, note and action item tables concurrently
+        from api.repositories.impl.user_repository_impl import UserRepositoryImpl
+        user_repository = UserRepositoryImpl()
+        await asyncio.gather(
+            user_repository.create_user_table(),
+            get_project_repository().create_table(),
+            get_note_repository().create_table(),
+            get_action_item_repository().create_table(),
+        )
+        
+        logger.info(f"Application initialized successfully (debug={app.debug})")
+        logger.info("Application startup complete")
+    except Exception as e:
+        logger.error(f"Error during application startup: {str(e)}", exc_info=True)
+        raise
+    
+    yield
+    
+    logger.info("Shutting down application...")
+    logger.info("Application shutdown complete")
+
 app = FastAPI(
     title="Project Notes API",
     description="API for managing projects and notes with AI-powered summaries",
     version="1.0.0",
-    debug=True
+    debug=not IS_PRODUCTION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Configure CORS (normalized once; a frozenset makes origin checks O(1))
+cors_origins = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGIN", "http://localhost:3000").split(",")
+    if origin.strip()
 )
 
-# Configure CORS
-cors_origins = os.getenv("CORS_ORIGIN", "http://localhost:3000").split(",")
+
+def _cors_origin_pattern(origin: str) -> str:
+    """
+    Convert a wildcard CORS origin into a regex.
+    
+    A bare "*" allows any origin, as it did when passed to allow_origins.
+    Otherwise "*" matches a single host label, e.g. https://*.fly.dev.
+    """
+    if origin == "*":
+        return ".*"
+    return re.escape(origin).replace(r"\*", r"[A-Za-z0-9-]+")
+
+
+# Wildcard entries become one precompiled regex; exact origins stay in the
+# set, so the response echoes the request origin rather than a literal "*"
+cors_origin_regex = "|".join(
+    _cors_origin_pattern(origin)
+    for origin in cors_origins
+    if "*" in origin
+) or None
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=cors_origins,
+    allow_origins=frozenset(origin for origin in cors_origins if "*" not in origin),
+    allow_origin_regex=cors_origin_regex,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["*"],  # Expose all headers to the client
+    # Headers the frontend actually sends/reads (see frontend/src/hooks/useAuth.js)
+    allow_headers=["authorization", "content-type", "accept", "x-correlation-id"],
+    expose_headers=["x-correlation-id"],
 )
 
 # Add logging middleware
-# app.add_middleware(LoggingMiddleware)
+app.add_middleware(LoggingMiddleware)
+
+# Compress larger JSON responses (small ones such as /health are sent as-is)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Phase 3: Initialize FastAPI dependencies
 setup_dependencies()
 
-# Create DynamoDB tables if they don't exist
-@app.on_event("startup")
-async def startup_event():
-    try:
-        logger.info("Initializing application...")
-        
-        # Initialize auth tables through user service (which has the dependency chain)
-        from api.repositories.impl.user_repository_impl import UserRepositoryImpl
-        user_repository = UserRepositoryImpl()
-        await user_repository.create_user_table()
-        
-        # Initialize project tables
-        project_repository = get_project_repository()
-        await project_repository.create_table()
-        
-        # Initialize note tables
-        note_repository = get_note_repository()
-        await note_repository.create_table()
-        
-        # Initialize action items tables
-        action_item_repository = get_action_item_repository()
-        await action_item_repository.create_table()
-        
-        logger.info("Application initialized successfully")
-        logger.info("Application startup complete")
-    except Exception as e:
-        logger.error(f"Error during application startup: {str(e)}", exc_info=True)
-        raise
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info("Shutting down application...")
-    logger.info("Application shutdown complete")
-
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["auth"])
 app.include_router(project_router, tags=["projects"])
@@ -110,11 +147,16 @@ app.include_router(note_router, tags=["notes"])
 # app.include_router(ai_file_router, tags=["ai-files"])
 app.include_router(action_item_router, tags=["action-items"])
 
+# Static bodies for the root and health endpoints, serialized once
+_ROOT_BYTES = orjson.dumps({"message": "Welcome to the API Data"})
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "backend"})
+
 @app.get("/")
 async def read_root():
-    return {"message": "Welcome to the API Data"} 
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring and debugging"""
-    return {"status": "healthy", "service": "backend"} 
\ No newline at end of file
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
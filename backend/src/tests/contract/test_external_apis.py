@@ -6,13 +6,40 @@ our integration contracts remain valid without hitting real APIs
 during test runs.
 """
 
+import copy
+import os
+
 import pytest
 import vcr
 from unittest.mock import patch
+from vcr.persisters.filesystem import FilesystemPersister
 
 from api.services.ai_service import AIService
 
 
+class CachedPersister(FilesystemPersister):
+    """
+    Filesystem persister that keeps parsed cassettes in memory.
+    
+    Cassettes are keyed by path and mtime, so a re-recorded cassette is
+    parsed again while unchanged ones are only read from disk once.
+    """
+    
+    _cache = {}
+    
+    @classmethod
+    def load_cassette(cls, cassette_path, serializer):
+        try:
+            key = (str(cassette_path), os.path.getmtime(cassette_path))
+        except OSError:
+            # Missing cassette: let VCR's own CassetteNotFoundError drive recording
+            return super().load_cassette(cassette_path, serializer)
+        
+        if key not in cls._cache:
+            cls._cache[key] = super().load_cassette(cassette_path, serializer)
+        return copy.deepcopy(cls._cache[key])
+
+
 @pytest.mark.vcr()
 def test_ai_service_openai_contract():
     """
@@ -22,7 +49,7 @@ def test_ai_service_openai_contract():
     then replays it on subsequent runs for fast, reliable testing.
     """
     # Use VCR to record/replay the API call
-    with vcr.use_cassette('tests/fixtures/vcr_cassettes/openai_generate_response.yaml'):
+    with _VCR.use_cassette('openai_generate_response.yaml'):
         ai_service = AIService()
         
         # Test the actual API contract
@@ -44,7 +71,7 @@ def test_ai_service_content_analysis_contract():
     
     Records the API interaction for content analysis functionality.
     """
-    with vcr.use_cassette('tests/fixtures/vcr_cassettes/openai_analyze_content.yaml'):
+    with _VCR.use_cassette('openai_analyze_content.yaml'):
         ai_service = AIService()
         
         test_content = """
@@ -71,7 +98,7 @@ def test_ai_service_error_handling_contract():
     
     Tests how our service handles various API error conditions.
     """
-    with vcr.use_cassette('tests/fixtures/vcr_cassettes/openai_error_handling.yaml'):
+    with _VCR.use_cassette('openai_error_handling.yaml'):
         ai_service = AIService()
         
         # Test with invalid/empty prompt
@@ -106,6 +133,14 @@ def test_database_contract():
     pass
 
 
+# Sensitive headers and the values they are replaced with in cassettes
+_SENSITIVE_HEADERS = {
+    'authorization': ['Bearer REDACTED'],
+    'x-api-key': ['REDACTED'],
+}
+_SENSITIVE_HEADER_NAMES = frozenset(_SENSITIVE_HEADERS)
+
+
 # Helper function to clean up sensitive data from VCR cassettes
 def scrub_sensitive_data(response):
     """
@@ -114,24 +149,34 @@ def scrub_sensitive_data(response):
     This function removes API keys, tokens, and other sensitive
     information from recorded cassettes.
     """
-    if 'authorization' in response['headers']:
-        response['headers']['authorization'] = ['Bearer REDACTED']
+    headers = response['headers']
+    
+    # Most responses carry neither header; skip them without touching the dict
+    if _SENSITIVE_HEADER_NAMES.isdisjoint(headers):
+        return response
     
-    if 'x-api-key' in response['headers']:
-        response['headers']['x-api-key'] = ['REDACTED']
+    for name in _SENSITIVE_HEADER_NAMES.intersection(headers):
+        headers[name] = list(_SENSITIVE_HEADERS[name])
     
     return response
 
 
+# Shared VCR configuration; one VCR instance serves every contract test
+_VCR_CONFIG = {
+    "filter_headers": ["authorization", "x-api-key"],
+    "before_record_response": scrub_sensitive_data,
+    "ignore_localhost": True,
+    "record_mode": "once",
+    "match_on": ["uri", "method", "body"],
+    "cassette_library_dir": "tests/fixtures/vcr_cassettes"
+}
+
+_VCR = vcr.VCR(serializer='yaml', **_VCR_CONFIG)
+_VCR.register_persister(CachedPersister)
+
+
 # Configure VCR for all contract tests
 @pytest.fixture(scope="module")
 def vcr_config():
     """VCR configuration for contract tests."""
-    return {
-        "filter_headers": ["authorization", "x-api-key"],
-        "before_record_response": scrub_sensitive_data,
-        "ignore_localhost": True,
-        "record_mode": "once",
-        "match_on": ["uri", "method", "body"],
-        "cassette_library_dir": "tests/fixtures/vcr_cassettes"
-    } 
\ No newline at end of file
+    return dict(_VCR_CONFIG)
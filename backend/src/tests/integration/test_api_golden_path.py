@@ -6,14 +6,14 @@ to ensure the wiring remains valid. This is the "golden" happy-path
 test that should run in CI to catch integration issues.
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch
 
-from main import app
-
 
-def test_golden_path_create_and_get_project(integration_client):
+@pytest.mark.asyncio
+async def test_golden_path_create_and_get_project(integration_async_client):
     """
     Golden path integration test: Create project and retrieve it.
     
@@ -37,7 +37,7 @@ def test_golden_path_create_and_get_project(integration_client):
             "type": "test"
         }
         
-        create_response = integration_client.post("/api/projects", json=create_payload)
+        create_response = await integration_async_client.post("/api/projects", json=create_payload)
         
         # Verify creation succeeded
         assert create_response.status_code == 200
@@ -45,8 +45,12 @@ def test_golden_path_create_and_get_project(integration_client):
         assert project_data["name"] == create_payload["name"]
         project_id = project_data["id"]
         
-        # Step 2: Retrieve the created project
-        get_response = integration_client.get(f"/api/projects/{project_id}")
+        # Steps 2 and 3: Retrieve the created project and list all projects
+        # (independent reads, so issue them concurrently)
+        get_response, list_response = await asyncio.gather(
+            integration_async_client.get(f"/api/projects/{project_id}"),
+            integration_async_client.get("/api/projects")
+        )
         
         # Verify retrieval succeeded
         assert get_response.status_code == 200
@@ -54,16 +58,14 @@ def test_golden_path_create_and_get_project(integration_client):
         assert retrieved_project["id"] == project_id
         assert retrieved_project["name"] == create_payload["name"]
         
-        # Step 3: List all projects (should include our test project)
-        list_response = integration_client.get("/api/projects")
-        
-        # Verify listing succeeded
+        # Verify listing succeeded (should include our test project)
         assert list_response.status_code == 200
         projects = list_response.json()
         assert any(p["id"] == project_id for p in projects)
 
 
-def test_golden_path_note_workflow(integration_client):
+@pytest.mark.asyncio
+async def test_golden_path_note_workflow(integration_async_client):
     """
     Golden path for note workflow: Create project, add note, retrieve notes.
     
@@ -78,7 +80,7 @@ def test_golden_path_note_workflow(integration_client):
             "description": "Project for note testing"
         }
         
-        project_response = integration_client.post("/api/projects", json=project_payload)
+        project_response = await integration_async_client.post("/api/projects", json=project_payload)
         assert project_response.status_code == 200
         project_id = project_response.json()["id"]
         
@@ -89,35 +91,32 @@ def test_golden_path_note_workflow(integration_client):
             "project_id": project_id
         }
         
-        note_response = integration_client.post("/api/notes", json=note_payload)
+        note_response = await integration_async_client.post("/api/notes", json=note_payload)
         assert note_response.status_code == 200
         note_data = note_response.json()
         assert note_data["title"] == note_payload["title"]
         note_id = note_data["id"]
         
         # Step 3: Retrieve notes for the project
-        notes_response = integration_client.get(f"/api/projects/{project_id}/notes")
+        notes_response = await integration_async_client.get(f"/api/projects/{project_id}/notes")
         assert notes_response.status_code == 200
         notes = notes_response.json()
         assert len(notes) >= 1
         assert any(n["id"] == note_id for n in notes)
 
 
-def test_golden_path_error_handling(integration_client):
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method,path,payload,expected_status", [
+    # 404 for non-existent project
+    ("GET", "/api/projects/non-existent-id", None, 404),
+    # Validation error for invalid payload (empty name should fail validation)
+    ("POST", "/api/projects", {"name": "", "description": "Test"}, 422),
+])
+async def test_golden_path_error_handling(integration_async_client, method, path, payload, expected_status):
     """
     Golden path for error handling: Verify proper error responses.
     
     This test ensures error handling works correctly through all layers.
     """
-    # Test 404 for non-existent project
-    response = integration_client.get("/api/projects/non-existent-id")
-    assert response.status_code == 404
-    
-    # Test validation error for invalid payload
-    invalid_payload = {
-        "name": "",  # Empty name should fail validation
-        "description": "Test"
-    }
-    
-    response = integration_client.post("/api/projects", json=invalid_payload)
-    assert response.status_code == 422  # Validation error 
\ No newline at end of file
+    response = await integration_async_client.request(method, path, json=payload)
+    assert response.status_code == expected_status
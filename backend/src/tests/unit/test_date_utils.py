@@ -0,0 +1,100 @@
+"""
+Unit Tests for Date Utilities
+
+These tests pin the parsing and batch helpers in utils.date_utils.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from utils.date_utils import (
+    days_between, days_between_batch, format_timestamp_iso, is_weekend,
+    is_weekend_batch, next_business_day, next_business_day_batch, parse_iso_date
+)
+
+# Monday 2024-01-01 through Sunday 2024-01-07, 09:30 UTC
+WEEK = [datetime(2024, 1, day, 9, 30, tzinfo=timezone.utc) for day in range(1, 8)]
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("2023-01-01T12:00:00.000Z", datetime(2023, 1, 1, 12, tzinfo=timezone.utc)),
+    ("2023-01-01T12:00:00Z", datetime(2023, 1, 1, 12, tzinfo=timezone.utc)),
+    ("2023-01-01T12:00:00.123456", datetime(2023, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)),
+    ("2023-01-01T12:00:00", datetime(2023, 1, 1, 12, tzinfo=timezone.utc)),
+    ("2023-01-01 12:00:00", datetime(2023, 1, 1, 12, tzinfo=timezone.utc)),
+    ("2023-01-01", datetime(2023, 1, 1, tzinfo=timezone.utc)),
+    ("  2023-01-01  ", datetime(2023, 1, 1, tzinfo=timezone.utc)),
+    # strptime accepts unpadded fields; the fallback keeps that working
+    ("2023-1-5", datetime(2023, 1, 5, tzinfo=timezone.utc)),
+])
+def test_parse_iso_date_accepted_formats(value, expected):
+    """Test that every supported format parses to a UTC datetime."""
+    result = parse_iso_date(value)
+    
+    assert result == expected
+    assert result.tzinfo is timezone.utc
+
+
+@pytest.mark.parametrize("value", [
+    "2023-01-01T12:00:00+05:00",
+    "2023-W01-1",
+    "20230101",
+    "2023-02-30",
+    "2023-01-01T12:00",
+    "not a date",
+    "",
+    None,
+])
+def test_parse_iso_date_rejects_unsupported_input(value):
+    """Test that shapes outside the supported formats return None."""
+    assert parse_iso_date(value) is None
+
+
+def test_parse_iso_date_reuses_cached_result():
+    """Test that repeated strings are served from the parse cache."""
+    first = parse_iso_date("2024-02-29T08:30:00Z")
+    
+    assert parse_iso_date(" 2024-02-29T08:30:00Z ") is first
+
+
+def test_days_between_batch_matches_days_between():
+    """Test that the batch helper agrees with days_between, including missing dates."""
+    starts = [WEEK[0], WEEK[6], None, WEEK[3]]
+    ends = [WEEK[6] + timedelta(days=30), WEEK[0], WEEK[1], None]
+    
+    assert days_between_batch(starts, ends) == [days_between(s, e) for s, e in zip(starts, ends)]
+    assert days_between_batch(starts, ends) == [36, -6, 0, 0]
+
+
+def test_days_between_batch_rejects_mismatched_lengths():
+    """Test that unequal inputs raise instead of being silently truncated."""
+    with pytest.raises(ValueError):
+        days_between_batch(WEEK, WEEK[:3])
+
+
+def test_is_weekend_batch_matches_is_weekend():
+    """Test that the batch helper flags Saturday and Sunday only."""
+    dts = [*WEEK, None]
+    
+    assert is_weekend_batch(dts) == [is_weekend(dt) for dt in dts]
+    assert is_weekend_batch(dts) == [False] * 5 + [True, True, False]
+
+
+def test_next_business_day_batch_matches_next_business_day():
+    """Test that Friday through Sunday all roll forward to Monday."""
+    result = next_business_day_batch(WEEK)
+    
+    assert result == [next_business_day(dt) for dt in WEEK]
+    assert [dt.day for dt in result] == [2, 3, 4, 5, 8, 8, 8]
+
+
+@pytest.mark.parametrize("dt,expected", [
+    (datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc), "2024-01-01T09:30:00+00:00"),
+    (datetime(2024, 1, 1, 9, 30), "2024-01-01T09:30:00+00:00"),
+    (datetime(2024, 1, 1, 9, 30, 0, 5000, tzinfo=timezone(timedelta(hours=2))), "2024-01-01T09:30:00.005000+02:00"),
+    (None, ""),
+])
+def test_format_timestamp_iso(dt, expected):
+    """Test ISO formatting, treating naive datetimes as UTC."""
+    assert format_timestamp_iso(dt) == expected
@@ -0,0 +1,36 @@
+"""
+Unit Tests for Validation Utilities
+
+These tests pin the bulk password check in utils.validation_utils
+against the single-password validator it mirrors.
+"""
+
+import pytest
+
+from utils.validation_utils import validate_password_strength, validate_password_strength_batch
+
+PASSWORDS = [
+    "Str0ng!Pass",      # meets every rule
+    "Sh0r!t",           # too short
+    "nouppercase1!",    # no uppercase letter
+    "NOLOWERCASE1!",    # no lowercase letter
+    "NoDigitsHere!",    # no digit
+    "NoSpecial123",     # no special character
+    "Arabic٣Digit!",  # non-ASCII decimal digit, which \d accepts
+    "",
+    None,
+]
+
+
+def test_validate_password_strength_batch_matches_single_validator():
+    """Test that the batch check agrees with validate_password_strength for every case."""
+    expected = [validate_password_strength(password)[0] for password in PASSWORDS]
+    
+    assert validate_password_strength_batch(PASSWORDS) == expected
+    assert expected == [True, False, False, False, False, False, True, False, False]
+
+
+@pytest.mark.parametrize("passwords", [[], ["Str0ng!Pass"] * 3])
+def test_validate_password_strength_batch_preserves_length(passwords):
+    """Test that one result is returned per input password."""
+    assert len(validate_password_strength_batch(passwords)) == len(passwords)
@@ -15,33 +15,57 @@ IMPORTANT: Utils must not import from api, infrastructure, or any
 application-specific modules to maintain clean architecture.
 """
 
-from .text_utils import (
-    sanitize_text,
-    truncate_text,
-    extract_keywords,
-    normalize_whitespace
-)
+import importlib
 
-from .validation_utils import (
-    validate_email,
-    validate_uuid,
-    validate_json_schema,
-    sanitize_input
-)
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so touching one helper doesn't load them all.
+_LAZY = {
+    # Text utilities
+    'sanitize_text': 'text_utils',
+    'truncate_text': 'text_utils',
+    'extract_keywords': 'text_utils',
+    'normalize_whitespace': 'text_utils',
+    
+    # Validation utilities
+    'validate_email': 'validation_utils',
+    'validate_uuid': 'validation_utils',
+    'validate_json_schema': 'validation_utils',
+    'sanitize_input': 'validation_utils',
+    
+    # Date utilities
+    'format_timestamp': 'date_utils',
+    'format_timestamp_iso': 'date_utils',
+    'parse_iso_date': 'date_utils',
+    'get_utc_now': 'date_utils',
+    'days_between': 'date_utils',
+    
+    # Constants
+    'DEFAULT_PAGE_SIZE': 'constants',
+    'MAX_TEXT_LENGTH': 'constants',
+    'SUPPORTED_FILE_TYPES': 'constants',
+    'HTTP_STATUS_CODES': 'constants',
+    'EMAIL_RE': 'constants',
+    'UUID_RE': 'constants',
+    'PHONE_RE': 'constants'
+}
+
+
+def __getattr__(name):
+    # Submodules used to be imported eagerly, so keep utils.<submodule> working
+    if name in _LAZY.values():
+        return importlib.import_module(f'.{name}', __name__)
+    
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
 
-from .date_utils import (
-    format_timestamp,
-    parse_iso_date,
-    get_utc_now,
-    days_between
-)
 
-from .constants import (
-    DEFAULT_PAGE_SIZE,
-    MAX_TEXT_LENGTH,
-    SUPPORTED_FILE_TYPES,
-    HTTP_STATUS_CODES
-)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     # Text utilities
@@ -58,6 +82,7 @@ __all__ = [
     
     # Date utilities
     'format_timestamp',
+    'format_timestamp_iso',
     'parse_iso_date',
     'get_utc_now',
     'days_between',
@@ -66,5 +91,8 @@ __all__ = [
     'DEFAULT_PAGE_SIZE',
     'MAX_TEXT_LENGTH',
     'SUPPORTED_FILE_TYPES',
-    'HTTP_STATUS_CODES'
+    'HTTP_STATUS_CODES',
+    'EMAIL_RE',
+    'UUID_RE',
+    'PHONE_RE'
 ] 
\ No newline at end of file
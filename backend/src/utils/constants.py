@@ -6,7 +6,11 @@ multiple modules. These constants have no dependencies and are safe
 to import from anywhere in the application.
 """
 
+import logging
+import re
 from enum import Enum
+from http import HTTPStatus
+from types import MappingProxyType
 from typing import Dict, List
 
 # Pagination defaults
@@ -19,28 +23,15 @@ MAX_TITLE_LENGTH = 200
 MAX_DESCRIPTION_LENGTH = 1000
 
 # File handling
-SUPPORTED_FILE_TYPES = [
+SUPPORTED_FILE_TYPES = frozenset({
     'txt', 'md', 'pdf', 'doc', 'docx', 
     'json', 'csv', 'xlsx', 'pptx'
-]
+})
 
 MAX_FILE_SIZE_MB = 10
 MAX_FILES_PER_UPLOAD = 5
 
-# HTTP Status Codes (commonly used)
-class HTTPStatus:
-    """HTTP status codes for consistent usage across the application."""
-    OK = 200
-    CREATED = 201
-    NO_CONTENT = 204
-    BAD_REQUEST = 400
-    UNAUTHORIZED = 401
-    FORBIDDEN = 403
-    NOT_FOUND = 404
-    CONFLICT = 409
-    UNPROCESSABLE_ENTITY = 422
-    INTERNAL_SERVER_ERROR = 500
-
+# HTTP Status Codes (stdlib IntEnum; HTTPStatus.OK == 200, etc.)
 HTTP_STATUS_CODES = HTTPStatus
 
 # API Response formats
@@ -56,6 +47,17 @@ EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 UUID_PATTERN = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
 PHONE_PATTERN = r'^\+?1?\d{9,15}$'
 
+# Compiled once so validators don't go through re's pattern cache per call
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+UUID_RE = re.compile(UUID_PATTERN, re.IGNORECASE)
+PHONE_RE = re.compile(PHONE_PATTERN)
+
+# str.translate table that deletes null bytes and other control characters
+# (everything below 0x20 except tab, newline and carriage return, plus DEL)
+CONTROL_CHAR_TRANS = MappingProxyType(dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+))
+
 # Date/Time formats
 ISO_DATE_FORMAT = "%Y-%m-%d"
 ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
@@ -71,17 +73,19 @@ SHORT_CACHE_TTL = 60    # 1 minute
 DEFAULT_RATE_LIMIT = 100  # requests per minute
 BURST_RATE_LIMIT = 200   # burst allowance
 
-# Logging levels
-LOG_LEVELS = {
-    'DEBUG': 10,
-    'INFO': 20,
-    'WARNING': 30,
-    'ERROR': 40,
-    'CRITICAL': 50
-}
-
-# Common error messages
-ERROR_MESSAGES = {
+# Logging levels (read-only view over the stdlib logging constants)
+LOG_LEVELS = MappingProxyType({
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+})
+
+# Common error messages (read-only; the file type list is joined once)
+_SUPPORTED_TYPES_STR = ", ".join(sorted(SUPPORTED_FILE_TYPES))
+
+ERROR_MESSAGES = MappingProxyType({
     'INVALID_INPUT': 'Invalid input provided',
     'RESOURCE_NOT_FOUND': 'Requested resource not found',
     'UNAUTHORIZED_ACCESS': 'Unauthorized access attempt',
@@ -89,8 +93,8 @@ ERROR_MESSAGES = {
     'INTERNAL_ERROR': 'An internal error occurred',
     'RATE_LIMIT_EXCEEDED': 'Rate limit exceeded',
     'FILE_TOO_LARGE': f'File size exceeds {MAX_FILE_SIZE_MB}MB limit',
-    'UNSUPPORTED_FILE_TYPE': f'File type not supported. Allowed: {", ".join(SUPPORTED_FILE_TYPES)}'
-}
+    'UNSUPPORTED_FILE_TYPE': f'File type not supported. Allowed: {_SUPPORTED_TYPES_STR}'
+})
 
 # Environment types
 class Environment(Enum):
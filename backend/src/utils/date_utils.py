@@ -6,10 +6,49 @@ dependencies. These functions are safe to use throughout the application
 for common date/time operations.
 """
 
+import re
+from bisect import bisect_right
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
 from .constants import ISO_DATE_FORMAT, ISO_DATETIME_FORMAT, DISPLAY_DATE_FORMAT, DISPLAY_DATETIME_FORMAT
 
+# ISO formats accepted by parse_iso_date when datetime.fromisoformat fails
+_ISO_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",      # 2023-01-01T12:00:00.000Z
+    "%Y-%m-%dT%H:%M:%SZ",         # 2023-01-01T12:00:00Z
+    "%Y-%m-%dT%H:%M:%S.%f",       # 2023-01-01T12:00:00.000
+    "%Y-%m-%dT%H:%M:%S",          # 2023-01-01T12:00:00
+    "%Y-%m-%d %H:%M:%S",          # 2023-01-01 12:00:00
+    "%Y-%m-%d",                   # 2023-01-01
+)
+
+# Shapes of _ISO_FORMATS that datetime.fromisoformat parses identically; other
+# ISO 8601 forms it accepts (UTC offsets, week dates, ...) were never supported
+_FAST_ISO_RE = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+    r'(?:T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?Z?| [0-9]{2}:[0-9]{2}:[0-9]{2})?'
+)
+
+# Bound once; get_utc_now sits on most defaulting paths in this module
+_now = datetime.now
+_UTC = timezone.utc
+
+# Days from each weekday (Monday=0) to the next business day
+_NEXT_BUSINESS_DAY_OFFSET = (1, 1, 1, 1, 3, 2, 1)
+
+# Lower bounds (in seconds) and units used by format_relative_time;
+# anything under the first bound is "just now"
+_RELATIVE_THRESHOLDS = (10, 60, 3600, 86400, 2592000, 31536000)
+_RELATIVE_UNITS = (
+    ("second", 1),
+    ("minute", 60),
+    ("hour", 3600),
+    ("day", 86400),
+    ("month", 2592000),   # 30 days
+    ("year", 31536000),   # 365 days
+)
+
 
 def get_utc_now() -> datetime:
     """
@@ -18,7 +57,7 @@ def get_utc_now() -> datetime:
     Returns:
         Current UTC datetime
     """
-    return datetime.now(timezone.utc)
+    return _now(_UTC)
 
 
 def format_timestamp(dt: datetime, format_string: str = ISO_DATETIME_FORMAT) -> str:
@@ -39,9 +78,40 @@ def format_timestamp(dt: datetime, format_string: str = ISO_DATETIME_FORMAT) ->
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     
+    # Aware datetimes for the same instant compare equal across zones,
+    # so the offset and zone name are part of the cache key
+    return _format_cached(dt, dt.utcoffset(), dt.tzname(), format_string)
+
+
+@lru_cache(maxsize=4096)
+def _format_cached(dt: datetime, utcoffset: timedelta, tzname: str, format_string: str) -> str:
+    """strftime memoized per timestamp and format; list views repeat the same values."""
     return dt.strftime(format_string)
 
 
+def format_timestamp_iso(dt: datetime) -> str:
+    """
+    Format datetime as an ISO 8601 string.
+    
+    Faster than format_timestamp for hot paths that only need ISO output,
+    since datetime.isoformat does not interpret a format string.
+    
+    Args:
+        dt: Datetime to format
+        
+    Returns:
+        ISO 8601 datetime string
+    """
+    if not dt:
+        return ""
+    
+    # Ensure timezone awareness
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    
+    return dt.isoformat()
+
+
 def parse_iso_date(date_string: str) -> Optional[datetime]:
     """
     Parse ISO format date string to datetime.
@@ -55,27 +125,41 @@ def parse_iso_date(date_string: str) -> Optional[datetime]:
     if not date_string or not isinstance(date_string, str):
         return None
     
-    # Try different ISO formats
-    formats_to_try = [
-        "%Y-%m-%dT%H:%M:%S.%fZ",      # 2023-01-01T12:00:00.000Z
-        "%Y-%m-%dT%H:%M:%SZ",         # 2023-01-01T12:00:00Z
-        "%Y-%m-%dT%H:%M:%S.%f",       # 2023-01-01T12:00:00.000
-        "%Y-%m-%dT%H:%M:%S",          # 2023-01-01T12:00:00
-        "%Y-%m-%d %H:%M:%S",          # 2023-01-01 12:00:00
-        "%Y-%m-%d",                   # 2023-01-01
-    ]
+    return _parse_iso_string(date_string.strip())
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_string(date_string: str) -> Optional[datetime]:
+    """Parse a stripped ISO date string; memoized, since stored timestamps repeat."""
+    # Every accepted format starts with "YYYY-"; reject anything else
+    # before paying for a round of failed parse attempts
+    if len(date_string) < 8 or not (date_string[:4].isdigit() and date_string[4] == '-'):
+        return None
     
-    for fmt in formats_to_try:
+    # Fast path: the C-implemented ISO parser, for the shapes where it agrees
+    # with the explicit formats below
+    dt = None
+    if _FAST_ISO_RE.fullmatch(date_string):
         try:
-            dt = datetime.strptime(date_string.strip(), fmt)
-            # Add UTC timezone if not present
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
+            dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
         except ValueError:
-            continue
-    
-    return None
+            pass
+    
+    if dt is None:
+        # Fall back to the explicit formats for anything fromisoformat rejects
+        for fmt in _ISO_FORMATS:
+            try:
+                dt = datetime.strptime(date_string, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            return None
+    
+    # Add UTC timezone if not present, and report any offset as UTC
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
 def days_between(start_date: datetime, end_date: datetime) -> int:
@@ -217,24 +301,14 @@ def format_relative_time(dt: datetime, reference: Optional[datetime] = None) ->
         prefix = ""
         suffix = " ago"
     
-    # Calculate time units
-    if total_seconds < 60:
-        return f"{prefix}just now" if total_seconds < 10 else f"{prefix}{int(total_seconds)} seconds{suffix}"
-    elif total_seconds < 3600:
-        minutes = int(total_seconds // 60)
-        return f"{prefix}{minutes} minute{'s' if minutes != 1 else ''}{suffix}"
-    elif total_seconds < 86400:
-        hours = int(total_seconds // 3600)
-        return f"{prefix}{hours} hour{'s' if hours != 1 else ''}{suffix}"
-    elif total_seconds < 2592000:  # 30 days
-        days = int(total_seconds // 86400)
-        return f"{prefix}{days} day{'s' if days != 1 else ''}{suffix}"
-    elif total_seconds < 31536000:  # 365 days
-        months = int(total_seconds // 2592000)
-        return f"{prefix}{months} month{'s' if months != 1 else ''}{suffix}"
-    else:
-        years = int(total_seconds // 31536000)
-        return f"{prefix}{years} year{'s' if years != 1 else ''}{suffix}"
+    # Look up the largest unit that fits
+    index = bisect_right(_RELATIVE_THRESHOLDS, total_seconds)
+    if index == 0:
+        return f"{prefix}just now"
+    
+    unit, divisor = _RELATIVE_UNITS[index - 1]
+    count = int(total_seconds // divisor)
+    return f"{prefix}{count} {unit}{'s' if count != 1 else ''}{suffix}"
 
 
 def get_age_in_years(birth_date: datetime, reference_date: Optional[datetime] = None) -> int:
@@ -254,11 +328,12 @@ def get_age_in_years(birth_date: datetime, reference_date: Optional[datetime] =
     if reference_date is None:
         reference_date = get_utc_now()
     
-    age = reference_date.year - birth_date.year
-    
-    # Adjust if birthday hasn't occurred this year
-    if (reference_date.month, reference_date.day) < (birth_date.month, birth_date.day):
-        age -= 1
+    # Subtract one if the birthday hasn't occurred this year; month * 32 + day
+    # orders (month, day) pairs without building tuples
+    birthday_pending = (
+        reference_date.month * 32 + reference_date.day < birth_date.month * 32 + birth_date.day
+    )
+    age = reference_date.year - birth_date.year - birthday_pending
     
     return max(0, age)
 
@@ -293,10 +368,54 @@ def next_business_day(dt: datetime) -> datetime:
     if not dt:
         dt = get_utc_now()
     
-    next_day = dt + timedelta(days=1)
+    # Jump straight over the weekend instead of stepping a day at a time
+    return dt + timedelta(days=_NEXT_BUSINESS_DAY_OFFSET[dt.weekday()])
+
+
+def days_between_batch(start_dates: Iterable[datetime], end_dates: Iterable[datetime]) -> List[int]:
+    """
+    Calculate days between pairs of dates in bulk.
     
-    # Skip weekends
-    while not is_business_day(next_day):
-        next_day += timedelta(days=1)
+    Equivalent to calling days_between on each pair, but works on proleptic
+    ordinals so large batches avoid building a timedelta per pair.
     
-    return next_day 
\ No newline at end of file
+    Args:
+        start_dates: Start dates
+        end_dates: End dates, paired positionally with start_dates
+        
+    Returns:
+        Number of days between each pair (0 where either date is missing)
+        
+    Raises:
+        ValueError: If start_dates and end_dates differ in length
+    """
+    return [
+        end.toordinal() - start.toordinal() if start and end else 0
+        for start, end in zip(start_dates, end_dates, strict=True)
+    ]
+
+
+def is_weekend_batch(dts: Iterable[datetime]) -> List[bool]:
+    """
+    Check in bulk which datetimes fall on a weekend.
+    
+    Args:
+        dts: Datetimes to check
+        
+    Returns:
+        True for each weekend (Saturday or Sunday) datetime, False otherwise
+    """
+    return [bool(dt) and dt.weekday() >= 5 for dt in dts]
+
+
+def next_business_day_batch(dts: Iterable[datetime]) -> List[datetime]:
+    """
+    Get the next business day after each datetime.
+    
+    Args:
+        dts: Input datetimes
+        
+    Returns:
+        Next business day datetime for each input
+    """
+    return [next_business_day(dt) for dt in dts]
@@ -8,8 +8,28 @@ application for common text operations.
 
 import re
 import html
+from collections import Counter
 from typing import List, Optional, Set
-from .constants import MAX_TEXT_LENGTH
+from .constants import MAX_TEXT_LENGTH, CONTROL_CHAR_TRANS
+
+# Regexes shared by the helpers below
+_HTML_UNSAFE_RE = re.compile(r'[<>&"\']')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_SENTENCE_BODY_RE = re.compile(r'[^.!?\s][^.!?]*')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+# Common stop words ignored by extract_keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we',
+    'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his',
+    'its', 'our', 'their'
+})
 
 
 def sanitize_text(text: str) -> str:
@@ -25,11 +45,12 @@ def sanitize_text(text: str) -> str:
     if not text:
         return ""
     
-    # HTML escape to prevent XSS
-    sanitized = html.escape(text)
+    # HTML escape to prevent XSS (plain text has nothing to escape, so
+    # skip rebuilding the string when no metacharacter is present)
+    sanitized = html.escape(text) if _HTML_UNSAFE_RE.search(text) else text
     
     # Remove null bytes and other control characters
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
+    sanitized = sanitized.translate(CONTROL_CHAR_TRANS)
     
     # Normalize whitespace
     sanitized = normalize_whitespace(sanitized)
@@ -60,14 +81,13 @@ def truncate_text(text: str, max_length: int = MAX_TEXT_LENGTH, suffix: str = ".
     if truncate_at <= 0:
         return suffix[:max_length]
     
-    # Try to truncate at word boundary
-    truncated = text[:truncate_at]
-    last_space = truncated.rfind(' ')
+    # Try to truncate at word boundary (bounded rfind avoids copying the prefix first)
+    last_space = text.rfind(' ', 0, truncate_at)
     
     if last_space > truncate_at * 0.8:  # If we can save 80% of the text
-        truncated = truncated[:last_space]
+        truncate_at = last_space
     
-    return truncated + suffix
+    return text[:truncate_at] + suffix
 
 
 def normalize_whitespace(text: str) -> str:
@@ -84,7 +104,7 @@ def normalize_whitespace(text: str) -> str:
         return ""
     
     # Replace multiple whitespace characters with single space
-    normalized = re.sub(r'\s+', ' ', text)
+    normalized = _WHITESPACE_RE.sub(' ', text)
     
     # Trim leading and trailing whitespace
     return normalized.strip()
@@ -105,36 +125,15 @@ def extract_keywords(text: str, min_length: int = 3, max_keywords: int = 10) ->
     if not text:
         return []
     
-    # Convert to lowercase and remove punctuation
-    clean_text = re.sub(r'[^\w\s]', ' ', text.lower())
+    # Convert to lowercase and remove punctuation, then count the words
+    # that pass the length and stop-word filters
+    word_counts = Counter(
+        word for word in _NON_WORD_RE.sub(' ', text.lower()).split()
+        if len(word) >= min_length and word not in _STOP_WORDS and word.isalpha()
+    )
     
-    # Split into words
-    words = clean_text.split()
-    
-    # Filter by length and remove common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-        'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-        'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we',
-        'they', 'me', 'him', 'her', 'us', 'them', 'my', 'your', 'his', 'her',
-        'its', 'our', 'their'
-    }
-    
-    keywords = []
-    word_counts = {}
-    
-    for word in words:
-        if (len(word) >= min_length and 
-            word not in stop_words and 
-            word.isalpha()):
-            word_counts[word] = word_counts.get(word, 0) + 1
-    
-    # Sort by frequency and take top keywords
-    sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-    keywords = [word for word, count in sorted_words[:max_keywords]]
-    
-    return keywords
+    # Take the most frequent words without sorting the whole vocabulary
+    return [word for word, _ in word_counts.most_common(max_keywords)]
 
 
 def count_words(text: str) -> int:
@@ -150,9 +149,8 @@ def count_words(text: str) -> int:
     if not text:
         return 0
     
-    # Split on whitespace and filter empty strings
-    words = [word for word in text.split() if word.strip()]
-    return len(words)
+    # split() with no separator already drops empty strings
+    return len(text.split())
 
 
 def count_sentences(text: str) -> int:
@@ -168,11 +166,9 @@ def count_sentences(text: str) -> int:
     if not text:
         return 0
     
-    # Simple sentence detection based on punctuation
-    sentences = re.split(r'[.!?]+', text)
-    # Filter out empty strings
-    sentences = [s for s in sentences if s.strip()]
-    return len(sentences)
+    # Simple sentence detection based on punctuation: count the non-blank
+    # runs between terminators without building the split list
+    return sum(1 for _ in _SENTENCE_BODY_RE.finditer(text))
 
 
 def extract_emails(text: str) -> List[str]:
@@ -188,18 +184,13 @@ def extract_emails(text: str) -> List[str]:
     if not text:
         return []
     
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_emails = []
-    for email in emails:
-        if email.lower() not in seen:
-            seen.add(email.lower())
-            unique_emails.append(email)
+    # Remove case-insensitive duplicates, keeping the first spelling and
+    # the original order (dicts preserve insertion order)
+    unique_emails = {}
+    for email in _EMAIL_RE.findall(text):
+        unique_emails.setdefault(email.lower(), email)
     
-    return unique_emails
+    return list(unique_emails.values())
 
 
 def slug_from_text(text: str, max_length: int = 50) -> str:
@@ -220,8 +211,8 @@ def slug_from_text(text: str, max_length: int = 50) -> str:
     slug = text.lower()
     
     # Replace spaces and special characters with hyphens
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = _SLUG_STRIP_RE.sub('', slug)
+    slug = _SLUG_DASH_RE.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
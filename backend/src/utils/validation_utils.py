@@ -8,8 +8,54 @@ for input validation and data sanitization.
 
 import re
 import json
+import string
 from typing import Any, Dict, List, Optional, Union
-from .constants import EMAIL_PATTERN, UUID_PATTERN, PHONE_PATTERN
+from .constants import EMAIL_RE, UUID_RE, PHONE_RE, CONTROL_CHAR_TRANS
+
+# Validator patterns (email, UUID and phone live in constants)
+_PHONE_CLEAN_RE = re.compile(r'[\s\-\(\)\.]+')
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+_PWD_LOWER_RE = re.compile(r'[a-z]')
+_PWD_UPPER_RE = re.compile(r'[A-Z]')
+_PWD_DIGIT_RE = re.compile(r'\d')
+_PWD_SPECIAL_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+_UNSAFE_FILENAME_RE = re.compile(
+    r'\.\./|'  # Directory traversal
+    r'^\.|'    # Hidden files
+    r'[<>:"|?*]|'  # Invalid characters
+    r'^(?:CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])$',  # Windows reserved names
+    re.IGNORECASE)
+
+# Character classes a strong password must draw from (same sets as the
+# lower/upper/special _PWD_*_RE patterns), used by
+# validate_password_strength_batch. Digits stay on the regex because \d also
+# matches non-ASCII decimal digits.
+_PASSWORD_CHAR_CLASSES = (
+    frozenset(string.ascii_lowercase),
+    frozenset(string.ascii_uppercase),
+    frozenset('!@#$%^&*(),.?":{}|<>'),
+)
+
+# Schema type name -> (accepted Python types, description used in errors)
+_SCHEMA_TYPES = {
+    'string': (str, 'a string'),
+    'integer': (int, 'an integer'),
+    'number': ((int, float), 'a number'),
+    'boolean': (bool, 'a boolean'),
+    'array': (list, 'an array'),
+    'object': (dict, 'an object'),
+}
+
+# Characters a JSON document can start and end with; json.loads also
+# accepts NaN, Infinity and -Infinity, hence N, I and y
+_JSON_FIRST_CHARS = frozenset('{["-0123456789tfnNI')
+_JSON_LAST_CHARS = frozenset('}]"0123456789elNy')
 
 
 def validate_email(email: str) -> bool:
@@ -25,7 +71,7 @@ def validate_email(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
     
-    return bool(re.match(EMAIL_PATTERN, email.strip()))
+    return bool(EMAIL_RE.match(email.strip()))
 
 
 def validate_uuid(uuid_string: str) -> bool:
@@ -41,7 +87,7 @@ def validate_uuid(uuid_string: str) -> bool:
     if not uuid_string or not isinstance(uuid_string, str):
         return False
     
-    return bool(re.match(UUID_PATTERN, uuid_string.strip().lower()))
+    return bool(UUID_RE.match(uuid_string.strip()))
 
 
 def validate_phone(phone: str) -> bool:
@@ -58,8 +104,8 @@ def validate_phone(phone: str) -> bool:
         return False
     
     # Remove common separators
-    clean_phone = re.sub(r'[\s\-\(\)\.]+', '', phone)
-    return bool(re.match(PHONE_PATTERN, clean_phone))
+    clean_phone = _PHONE_CLEAN_RE.sub('', phone)
+    return bool(PHONE_RE.match(clean_phone))
 
 
 def validate_json_schema(data: Any, schema: Dict[str, Any]) -> tuple[bool, List[str]]:
@@ -89,19 +135,9 @@ def validate_json_schema(data: Any, schema: Dict[str, Any]) -> tuple[bool, List[
         
         # Type validation
         expected_type = field_schema.get('type')
-        if expected_type:
-            if expected_type == 'string' and not isinstance(value, str):
-                field_errors.append(f"{field_name} must be a string")
-            elif expected_type == 'integer' and not isinstance(value, int):
-                field_errors.append(f"{field_name} must be an integer")
-            elif expected_type == 'number' and not isinstance(value, (int, float)):
-                field_errors.append(f"{field_name} must be a number")
-            elif expected_type == 'boolean' and not isinstance(value, bool):
-                field_errors.append(f"{field_name} must be a boolean")
-            elif expected_type == 'array' and not isinstance(value, list):
-                field_errors.append(f"{field_name} must be an array")
-            elif expected_type == 'object' and not isinstance(value, dict):
-                field_errors.append(f"{field_name} must be an object")
+        type_check = _SCHEMA_TYPES.get(expected_type)
+        if type_check and not isinstance(value, type_check[0]):
+            field_errors.append(f"{field_name} must be {type_check[1]}")
         
         # Length validation for strings
         if isinstance(value, str):
@@ -176,7 +212,7 @@ def sanitize_input(value: Any, max_length: Optional[int] = None) -> str:
     sanitized = str(value).strip()
     
     # Remove null bytes and control characters
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
+    sanitized = sanitized.translate(CONTROL_CHAR_TRANS)
     
     # Truncate if necessary
     if max_length and len(sanitized) > max_length:
@@ -198,15 +234,7 @@ def validate_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return bool(url_pattern.match(url.strip()))
+    return bool(_URL_RE.match(url.strip()))
 
 
 def validate_password_strength(password: str) -> tuple[bool, List[str]]:
@@ -227,21 +255,50 @@ def validate_password_strength(password: str) -> tuple[bool, List[str]]:
     if len(password) < 8:
         issues.append("Password must be at least 8 characters long")
     
-    if not re.search(r'[a-z]', password):
+    if not _PWD_LOWER_RE.search(password):
         issues.append("Password must contain at least one lowercase letter")
     
-    if not re.search(r'[A-Z]', password):
+    if not _PWD_UPPER_RE.search(password):
         issues.append("Password must contain at least one uppercase letter")
     
-    if not re.search(r'\d', password):
+    if not _PWD_DIGIT_RE.search(password):
         issues.append("Password must contain at least one digit")
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not _PWD_SPECIAL_RE.search(password):
         issues.append("Password must contain at least one special character")
     
     return len(issues) == 0, issues
 
 
+def validate_password_strength_batch(passwords: List[str]) -> List[bool]:
+    """
+    Check many passwords against the validate_password_strength rules.
+    
+    Intended for bulk imports: each password's characters are collected
+    into a set once and tested against each character class, instead of
+    running a regex scan per requirement and building error messages.
+    
+    Args:
+        passwords: Passwords to validate
+        
+    Returns:
+        List of booleans, True where the password meets every requirement
+    """
+    results = []
+    for password in passwords:
+        if not password or not isinstance(password, str) or len(password) < 8:
+            results.append(False)
+            continue
+        
+        chars = set(password)
+        results.append(
+            not any(chars.isdisjoint(required) for required in _PASSWORD_CHAR_CLASSES)
+            and _PWD_DIGIT_RE.search(password) is not None
+        )
+    
+    return results
+
+
 def is_safe_filename(filename: str) -> bool:
     """
     Check if filename is safe for file system operations.
@@ -255,23 +312,12 @@ def is_safe_filename(filename: str) -> bool:
     if not filename or not isinstance(filename, str):
         return False
     
-    # Check for dangerous patterns
-    dangerous_patterns = [
-        r'\.\./',  # Directory traversal
-        r'^\.',    # Hidden files
-        r'[<>:"|?*]',  # Invalid characters
-        r'^(CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])$',  # Windows reserved names
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, filename, re.IGNORECASE):
-            return False
-    
     # Check length
     if len(filename) > 255:
         return False
     
-    return True
+    # Check for dangerous patterns in a single scan
+    return not _UNSAFE_FILENAME_RE.search(filename)
 
 
 def validate_json_string(json_string: str) -> tuple[bool, Optional[Dict]]:
@@ -287,8 +333,19 @@ def validate_json_string(json_string: str) -> tuple[bool, Optional[Dict]]:
     if not json_string or not isinstance(json_string, str):
         return False, None
     
+    # Only pay for strip() when there is surrounding whitespace (the
+    # common API payload has none)
+    if json_string[0].isspace() or json_string[-1].isspace():
+        json_string = json_string.strip()
+        if not json_string:
+            return False, None
+    
+    # Reject obvious non-JSON without entering the parser
+    if json_string[0] not in _JSON_FIRST_CHARS or json_string[-1] not in _JSON_LAST_CHARS:
+        return False, None
+    
     try:
-        parsed = json.loads(json_string.strip())
+        parsed = json.loads(json_string)
         return True, parsed
     except (json.JSONDecodeError, ValueError):
         return False, None 
\ No newline at end of file
@@ -7,33 +7,61 @@ This script monitors CapB's performance and health, providing insights into:
 - Error rates
 - Processing times
 - Action item tagging statistics
+
+Requires the backend package to be installed (pip install -e backend).
 """
 
 import sys
-import os
 import json
 from datetime import datetime, timedelta
-from tabulate import tabulate
 
-# Add the backend src path to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend', 'src'))
+from api.repositories.impl import get_ai_repository, get_action_item_repository
+from api.services.providers import (
+    get_monitoring_service,
+    get_ai_service,
+    get_action_item_service,
+    get_capb_service
+)
 
-from api.repositories.impl import get_capb_service
+# Display labels for the monitored time ranges
+_TIME_RANGE_LABELS = {
+    "hour": "Last Hour",
+    "day": "Last 24 Hours",
+    "week": "Last 7 Days",
+}
 
 def format_time_range(time_range: str) -> str:
     """Format time range for display."""
-    if time_range == "hour":
-        return "Last Hour"
-    elif time_range == "day":
-        return "Last 24 Hours"
-    elif time_range == "week":
-        return "Last 7 Days"
-    else:
-        return "All Time"
+    return _TIME_RANGE_LABELS.get(time_range, "All Time")
+
+def format_grid(rows: list, headers: list = None) -> str:
+    """
+    Render rows as a grid table (same layout as tabulate's "grid" format).
+    
+    The first column is left-aligned and the remaining columns right-aligned.
+    """
+    cells = [[str(cell) for cell in row] for row in rows]
+    if headers:
+        cells.insert(0, [str(header) for header in headers])
+    widths = [max(len(row[col]) for row in cells) for col in range(len(cells[0]))]
+    
+    def border(fill: str) -> str:
+        return "+" + "+".join(fill * (width + 2) for width in widths) + "+"
+    
+    def line(row: list) -> str:
+        padded = [row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+        return "| " + " | ".join(padded) + " |"
+    
+    separator = border("-")
+    lines = [separator]
+    for index, row in enumerate(cells):
+        lines.append(line(row))
+        lines.append(border("=") if headers and index == 0 else separator)
+    return "\n".join(lines)
 
 def format_percentage(value: float) -> str:
     """Format percentage for display."""
-    return f"{value * 100:.1f}%"
+    return f"{value:.1%}"
 
 def monitor_capb():
     """Monitor CapB's performance and health."""
@@ -42,7 +70,11 @@ def monitor_capb():
     
     try:
         # Get CapB service
-        capb_service = get_capb_service()
+        capb_service = get_capb_service(
+            get_ai_service(get_ai_repository()),
+            get_action_item_service(get_action_item_repository()),
+            get_monitoring_service()
+        )
         
         # Monitor different time ranges
         time_ranges = ["hour", "day", "week", "all"]
@@ -51,25 +83,26 @@ def monitor_capb():
             print(f"\n📊 {format_time_range(time_range)}")
             print("-" * 30)
             
-            # Get metrics
-            metrics = capb_service.get_metrics(time_range)
+            # Get metrics, success rate and error rates in one lookup
+            snapshot = capb_service.get_snapshot(time_range)
+            metrics = snapshot["metrics"]
             
             if not metrics:
                 print("No data available for this time range")
                 continue
             
             # Success rate
-            success_rate = capb_service.get_success_rate(time_range)
+            success_rate = snapshot["success_rate"]
             print(f"✅ Success Rate: {format_percentage(success_rate)}")
             
             # Error rates
-            error_rates = capb_service.get_error_rates(time_range)
+            error_rates = snapshot["error_rates"]
             if error_rates:
                 print("\n⚠️  Error Rates:")
                 error_table = []
                 for error_type, rate in error_rates.items():
                     error_table.append([error_type, format_percentage(rate)])
-                print(tabulate(error_table, headers=["Error Type", "Rate"], tablefmt="grid"))
+                print(format_grid(error_table, headers=["Error Type", "Rate"]))
             
             # Processing statistics
             print("\n⚡ Processing Statistics:")
@@ -81,7 +114,7 @@ def monitor_capb():
                 ["Items Tagged", metrics.get("items_tagged", 0)],
                 ["Avg Processing Time", f"{metrics.get('average_processing_time', 0):.2f}s"]
             ]
-            print(tabulate(stats_table, tablefmt="grid"))
+            print(format_grid(stats_table))
             
             # Tagging efficiency
             items_processed = metrics.get("items_processed", 0)
@@ -96,7 +129,7 @@ def monitor_capb():
                 error_table = []
                 for error_type, count in metrics["errors"].items():
                     error_table.append([error_type, count])
-                print(tabulate(error_table, headers=["Error Type", "Count"], tablefmt="grid"))
+                print(format_grid(error_table, headers=["Error Type", "Count"]))
         
         print("\n" + "=" * 50)
         print("🏁 Monitoring Complete")
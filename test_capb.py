@@ -4,29 +4,71 @@ Test script for CapB (Project Tagging) functionality.
 
 This script tests the ability to automatically tag action items with relevant projects
 based on semantic similarity.
+
+Requires the backend package to be installed (pip install -e backend).
 """
 
 import asyncio
+import logging
 import json
 import sys
-import os
-
-# Add the backend src path to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend', 'src'))
 
-from api.services.note_service import NoteService
-from api.services.action_item_service import ActionItemService
-from api.services.project_service import ProjectService
 from api.models.note import NoteCreate
 from api.models.project import ProjectCreate
 from api.repositories.impl import (
-    get_note_repository,
-    get_project_repository,
+    get_ai_repository,
+    get_action_item_repository
+)
+from api.services.providers import (
+    get_monitoring_service,
     get_ai_service,
     get_action_item_service,
-    get_capb_service
+    get_capb_service,
+    get_project_service,
+    get_note_service
 )
 
+logger = logging.getLogger(__name__)
+
+async def wait_for_action_items(action_item_service, user_id, initial_ids, timeout=10.0, interval=0.2):
+    """
+    Poll a user's action items until CapA and CapB have finished with a note.
+    
+    The items are settled once new ones (ids not in initial_ids) exist and
+    either all of them are tagged with a project or the list is unchanged
+    across two polls. A note may legitimately produce no new items, so
+    hitting the timeout is not an error.
+    
+    Returns:
+        The settled list of action items, or the last fetched list if they
+        don't settle within timeout seconds
+    """
+    last_items = None
+    
+    async def poll():
+        nonlocal last_items
+        previous = None
+        while True:
+            items = await action_item_service.get_action_items_by_user(user_id)
+            last_items = items
+            new_items = [item for item in items if item.id not in initial_ids]
+            if new_items:
+                if all(item.projects for item in new_items):
+                    return items
+                snapshot = {item.id: tuple(item.projects or ()) for item in items}
+                if snapshot == previous:
+                    return items
+                previous = snapshot
+            await asyncio.sleep(interval)
+    
+    try:
+        return await asyncio.wait_for(poll(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Action items did not settle within %.1fs; using the last fetched list", timeout)
+        if last_items is None:
+            last_items = await action_item_service.get_action_items_by_user(user_id)
+        return last_items
+
 async def test_capb():
     """Test CapB functionality with various scenarios."""
     
@@ -35,21 +77,12 @@ async def test_capb():
     
     # Initialize services
     try:
-        ai_service = get_ai_service()
-        action_item_service = get_action_item_service()
-        capb_service = get_capb_service()
-        project_service = ProjectService(ai_service=ai_service, capb_service=capb_service)
-        note_repository = get_note_repository()
-        project_repository = get_project_repository()
-        
-        note_service = NoteService(
-            note_repository=note_repository,
-            project_repository=project_repository,
-            project_service=project_service,
-            ai_service=ai_service,
-            action_item_service=action_item_service,
-            capb_service=capb_service
-        )
+        # The providers are FastAPI dependencies, so pass their dependencies explicitly
+        ai_service = get_ai_service(get_ai_repository())
+        action_item_service = get_action_item_service(get_action_item_repository())
+        capb_service = get_capb_service(ai_service, action_item_service, get_monitoring_service())
+        project_service = get_project_service(ai_service, capb_service)
+        note_service = get_note_service(ai_service, action_item_service, capb_service, project_service)
         
         print("✅ Services initialized successfully")
         
@@ -121,6 +154,19 @@ async def test_capb():
         }
     ]
     
+    # Fetch the user's action items and projects once; between scenarios each
+    # note's "final" list becomes the next note's "initial" list, and projects
+    # are tracked by name as they are created or updated instead of querying again
+    try:
+        known_items, existing_projects = await asyncio.gather(
+            action_item_service.get_action_items_by_user(test_user_id),
+            project_service.get_projects(test_user_id)
+        )
+    except Exception as e:
+        print(f"❌ Failed to load action items and projects: {e}")
+        return False
+    projects_by_name = {project.name: project for project in existing_projects}
+    
     for i, scenario in enumerate(test_scenarios, 1):
         print(f"\n📝 Test {i}: {scenario['name']}")
         
@@ -135,6 +181,7 @@ async def test_capb():
                         user_id=test_user_id
                     )
                     created_project = await project_service.create_project(project)
+                    projects_by_name[created_project.name] = created_project
                     print(f"✅ Created project: {created_project.name}")
             
             # Update projects if specified
@@ -142,23 +189,22 @@ async def test_capb():
                 print("\n🔄 Updating test projects:")
                 for update in scenario["project_updates"]:
                     # Get existing project
-                    projects = await project_service.get_projects(test_user_id)
-                    project = next((p for p in projects if p.name == update["name"]), None)
+                    project = projects_by_name.get(update["name"])
                     if project:
                         # Update project
                         updated_project = await project_service.update_project(
                             project.id,
                             {"description": update["new_description"]}
                         )
+                        projects_by_name[updated_project.name] = updated_project
                         print(f"✅ Updated project: {updated_project.name}")
             
             # Process notes
             for note_data in scenario["notes"]:
                 print(f"\n📝 Processing note: {note_data['content'][:100]}...")
                 
-                # Get initial action items
-                initial_items = await action_item_service.get_action_items_by_user(test_user_id)
-                initial_count = len(initial_items)
+                # Initial action items are the last known list
+                initial_count = len(known_items)
                 print(f"📊 Initial action items: {initial_count}")
                 
                 # Create note (this should trigger CapA and CapB)
@@ -170,12 +216,12 @@ async def test_capb():
                 created_note = await note_service.create_note(note)
                 print(f"✅ Created note: {created_note.id}")
                 
-                # Wait for processing
-                await asyncio.sleep(2)  # Give time for CapA and CapB to process
-                
-                # Get final action items
-                final_items = await action_item_service.get_action_items_by_user(test_user_id)
+                # Wait for CapA to create the new action items and CapB to tag them
+                final_items = await wait_for_action_items(
+                    action_item_service, test_user_id, {item.id for item in known_items}
+                )
                 final_count = len(final_items)
+                known_items = final_items
                 
                 print(f"📊 Final action items: {final_count}")
                 print(f"📈 Change: {final_count - initial_count} action items")
@@ -202,13 +248,13 @@ async def test_capb():
             
         except Exception as e:
             print(f"❌ Test failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("CapB scenario %d failed", i)
     
     print("\n" + "=" * 50)
     print("🏁 CapB Test Complete")
     
-    # Final summary
+    # Final summary; CapB tags items in the background, so fetch a fresh list
+    # rather than reusing the last per-scenario snapshot
     try:
         all_items = await action_item_service.get_action_items_by_user(test_user_id)
         tagged_items = [item for item in all_items if item.projects]
@@ -241,5 +287,13 @@ async def test_capb():
         return False
 
 if __name__ == "__main__":
-    success = asyncio.run(test_capb())
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    logging.basicConfig()
+    # Use uvloop's event loop when it is installed (not available on Windows)
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        success = runner.run(test_capb())
+    sys.exit(0 if success else 1)